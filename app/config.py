@@ -49,6 +49,8 @@ class Settings(BaseSettings):
     # Admin
     ADMIN_USERNAME: str = "admin"
     ADMIN_PASSWORD: str
+    BCRYPT_VERIFY_CACHE: bool = True
+    BCRYPT_ROUNDS: int = 12
     
     class Config:
         env_file = ".env"
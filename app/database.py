@@ -1,12 +1,19 @@
 """
 Database configuration and session management
 """
+import hashlib
+import logging
+from contextlib import contextmanager
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 def _resolve_database_url(url: str) -> str:
     """
@@ -20,12 +27,23 @@ def _resolve_database_url(url: str) -> str:
     return url
 
 
+def _driver_engine_options(url: str) -> dict:
+    """
+    Extra create_engine() options for the configured DBAPI driver.
+    psycopg2 also batches the UPDATE/DELETE executemany calls.
+    """
+    if make_url(url).drivername in ("postgresql", "postgresql+psycopg2"):
+        return {"executemany_mode": "values_plus_batch", "executemany_batch_page_size": 500}
+    return {}
+
+
 resolved_database_url = _resolve_database_url(settings.DATABASE_URL)
 
 # Create database engine
 engine = create_engine(
     resolved_database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in resolved_database_url else {}
+    connect_args={"check_same_thread": False} if "sqlite" in resolved_database_url else {},
+    **_driver_engine_options(resolved_database_url)
 )
 
 # Create session factory
@@ -47,9 +65,86 @@ def get_db():
         db.close()
 
 
+@contextmanager
+def no_expire_on_commit(session):
+    """
+    Keep loaded attributes valid across commits inside the block.
+    Avoids the follow-up SELECT that db.refresh() would otherwise need.
+    """
+    previous = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        yield session
+    finally:
+        session.expire_on_commit = previous
+
+
+def _schema_fingerprint() -> str:
+    """Hash of every table, column and index name declared on the models"""
+    parts = []
+    for table in sorted(Base.metadata.tables.values(), key=lambda t: t.name):
+        columns = sorted(f"{c.name}{'!' if c.unique else ''}" for c in table.columns)
+        indexes = sorted(f"{i.name}{'!' if i.unique else ''}" for i in table.indexes)
+        parts.append(f"{table.name}({','.join(columns)})[{','.join(indexes)}]")
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _upgrade_unique_project_titles(conn):
+    """
+    Rebuild ix_projects_title as a unique index on databases created before
+    Project.title was unique, refusing to run over duplicate titles.
+    """
+    duplicates = conn.execute(text(
+        "SELECT title, COUNT(*) FROM projects GROUP BY title HAVING COUNT(*) > 1"
+    )).all()
+    if duplicates:
+        listed = ", ".join(f"{title!r} (x{count})" for title, count in duplicates)
+        logger.error(
+            "Cannot make projects.title unique, duplicate titles found: %s", listed
+        )
+        raise RuntimeError(
+            f"Duplicate project titles prevent the unique index on projects.title: {listed}. "
+            "Rename or merge these projects, then restart."
+        )
+    conn.execute(text("DROP INDEX IF EXISTS ix_projects_title"))
+    conn.execute(text("CREATE UNIQUE INDEX ix_projects_title ON projects (title)"))
+
+
+# create_all never alters existing tables; these run whenever the schema
+# fingerprint changes to bring older databases in line (must be idempotent)
+_SCHEMA_UPGRADES = (
+    _upgrade_unique_project_titles,
+)
+
+
+def _applied_schema_fingerprint():
+    """Return the schema fingerprint recorded in the database, or None"""
+    from app.models import SchemaVersion
+    try:
+        with engine.connect() as conn:
+            return conn.scalar(select(SchemaVersion.fingerprint))
+    except DBAPIError:
+        # Marker table not created yet (or from an older marker layout)
+        return None
+
+
 def init_db():
-    """Initialize database tables"""
+    """
+    Initialize database tables.
+    Skips create_all's per-table existence checks when the recorded schema
+    fingerprint matches the models.
+    """
     # Ensure all models are imported so SQLAlchemy metadata is fully populated.
     # Without this, create_all may run with an incomplete table registry.
     from app import models  # noqa: F401
+    fingerprint = _schema_fingerprint()
+    if _applied_schema_fingerprint() == fingerprint:
+        return
     Base.metadata.create_all(bind=engine)
+    marker = models.SchemaVersion.__table__
+    with engine.begin() as conn:
+        for upgrade in _SCHEMA_UPGRADES:
+            upgrade(conn)
+        marker.drop(conn, checkfirst=True)
+        marker.create(conn)
+        conn.execute(insert(marker).values(fingerprint=fingerprint))
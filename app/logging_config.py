@@ -102,6 +102,24 @@ class JsonFormatter(logging.Formatter):
         return json.dumps(payload, ensure_ascii=True)
 
 
+class BoundLogger(logging.LoggerAdapter):
+    """Logger adapter that merges bound context into every record's extra."""
+
+    def process(self, msg: Any, kwargs: Any) -> tuple[Any, Any]:
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
+    def bind(self, **context: Any) -> "BoundLogger":
+        """Return a child logger with additional bound context."""
+        return BoundLogger(self.logger, {**self.extra, **context})
+
+
+def bind_logger(logger: logging.Logger, **context: Any) -> BoundLogger:
+    """Wrap a logger so the given keys are added to every record."""
+    return BoundLogger(logger, context)
+
+
 def _build_rotating_handler(file_path: Path) -> RotatingFileHandler:
     handler = RotatingFileHandler(
         filename=file_path,
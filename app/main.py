@@ -17,6 +17,7 @@ from app.database import init_db
 from app.database import SessionLocal
 from app.models import Student
 from app.routers import student, admin, auth
+from app.services.sms_service import sms_service
 from app.config import settings
 from app.logging_config import (
     configure_root_logging,
@@ -266,7 +267,13 @@ async def startup_event():
     logger.info("Initializing database...")
     init_db()
     logger.info("Database initialized successfully")
-    logger.info(f"Application started in {'DEBUG' if settings.DEBUG else 'PRODUCTION'} mode")
+    logger.info("Application started in %s mode", "DEBUG" if settings.DEBUG else "PRODUCTION")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled outbound connections"""
+    await sms_service.aclose()
 
 
 @app.exception_handler(Exception)
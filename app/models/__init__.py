@@ -7,6 +7,7 @@ from app.models.assignment import Assignment
 from app.models.otp import OTPCode
 from app.models.activity_log import ActivityLog
 from app.models.admin import AdminUser
+from app.models.schema_version import SchemaVersion
 
 __all__ = [
     "Student",
@@ -15,4 +16,5 @@ __all__ = [
     "OTPCode",
     "ActivityLog",
     "AdminUser",
+    "SchemaVersion",
 ]
@@ -11,7 +11,7 @@ class Project(Base):
     __tablename__ = "projects"
     
     id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, nullable=False, index=True)
+    title = Column(String, unique=True, nullable=False, index=True)
     description = Column(Text, nullable=True)
     features = Column(Text, nullable=True)  # JSON string
     assigned_count = Column(Integer, default=0)
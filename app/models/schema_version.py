@@ -0,0 +1,14 @@
+"""
+Schema version marker model
+"""
+from sqlalchemy import Column, String
+from app.database import Base
+
+
+class SchemaVersion(Base):
+    __tablename__ = "schema_version"
+    
+    fingerprint = Column(String(64), primary_key=True)
+    
+    def __repr__(self):
+        return f"<SchemaVersion(fingerprint='{self.fingerprint}')>"
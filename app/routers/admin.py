@@ -10,7 +10,13 @@ from app.models import Student, AdminUser, Assignment
 from app.services.assignment_service import get_assignment_stats, get_all_assignments
 from app.services.logging_service import get_recent_logs, get_logs_by_student
 from app.services.pdf_service import generate_assignment_report, generate_student_theme_pdf
-from app.utils.security import verify_password, create_access_token, decode_access_token
+from app.utils.security import (
+    verify_password,
+    create_access_token,
+    decode_access_token,
+    hash_password,
+    needs_rehash,
+)
 from app.config import settings
 from pydantic import BaseModel
 from typing import Optional
@@ -65,6 +71,11 @@ async def admin_login(login_req: LoginRequest, response: Response, db: Session =
     
     if not admin or not verify_password(login_req.password, admin.password_hash):
         raise HTTPException(status_code=401, detail="Identifiants incorrects")
+
+    # Upgrade hashes made with a different bcrypt cost while the password is at hand
+    if needs_rehash(admin.password_hash):
+        admin.password_hash = hash_password(login_req.password)
+        db.commit()
     
     # Create access token
     token = create_access_token({"sub": admin.username})
@@ -190,7 +201,7 @@ async def export_pdf(
             headers={"Content-Disposition": "attachment; filename=rapport_attributions_gl3e.pdf"},
         )
     except Exception as exc:
-        logger.error(f"PDF export failed: {exc}")
+        logger.error("PDF export failed: %s", exc)
         raise HTTPException(status_code=500, detail="Impossible de générer le PDF pour le moment")
 
 
@@ -221,7 +232,7 @@ async def export_student_theme_pdf(
             headers={"Content-Disposition": f'attachment; filename="{filename}"'},
         )
     except Exception as exc:
-        logger.error(f"Student theme export failed for assignment {assignment_id}: {exc}")
+        logger.error("Student theme export failed for assignment %s: %s", assignment_id, exc)
         raise HTTPException(status_code=500, detail="Impossible de générer le PDF étudiant")
 
 
@@ -261,7 +272,7 @@ async def export_all_themes_zip(
             headers={"Content-Disposition": f'attachment; filename="{zip_name}"'},
         )
     except Exception as exc:
-        logger.error(f"Bulk theme ZIP export failed: {exc}")
+        logger.error("Bulk theme ZIP export failed: %s", exc)
         raise HTTPException(status_code=500, detail="Impossible de générer l'archive des thèmes")
 
 
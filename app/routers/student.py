@@ -190,7 +190,7 @@ async def request_project(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in request_project: {e}")
+        logger.error("Error in request_project: %s", e)
         raise HTTPException(status_code=500, detail="Une erreur est survenue")
 
 
@@ -303,7 +303,7 @@ async def verify_otp_endpoint(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in verify_otp: {e}")
+        logger.error("Error in verify_otp: %s", e)
         raise HTTPException(status_code=500, detail="Une erreur est survenue")
 
 
@@ -315,7 +315,7 @@ async def export_my_theme_pdf(payload: ThemePDFExportRequest, db: Session = Depe
     if not payload.code or not payload.code.isdigit() or len(payload.code) != 6:
         raise HTTPException(status_code=400, detail="Code OTP invalide")
 
-    otp = db.query(OTPCode).filter(OTPCode.id == payload.otp_id).first()
+    otp = db.get(OTPCode, payload.otp_id)
     if not otp:
         raise HTTPException(status_code=404, detail="Référence OTP introuvable")
     if not otp.verified:
@@ -5,13 +5,19 @@ import random
 import string
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
+from app.database import no_expire_on_commit
 from app.models.otp import OTPCode
 from app.models.student import Student
 from app.config import settings
 from app.logging_config import get_service_logger
+from app.utils.cache import TTLCache
 
 otp_sms_verify_logger = get_service_logger("otp_sms_verification")
 
+# Verified, expired and exhausted OTPs can never become valid again, so repeated
+# submissions against them (UI retries, double clicks) are answered from memory.
+_terminal_otp_cache = TTLCache(maxsize=2048, ttl_seconds=5)
+
 
 def _mask_contact_value(value: str | None) -> str:
     """Mask phone/email to avoid leaking sensitive data into logs."""
@@ -24,6 +30,45 @@ def _mask_contact_value(value: str | None) -> str:
     return f"{value[:8]}***"
 
 
+def _otp_snapshot(otp: OTPCode) -> OTPCode:
+    """Detached copy of the OTP fields callers read after a rejection."""
+    return OTPCode(
+        id=otp.id,
+        student_id=otp.student_id,
+        contact_method=otp.contact_method,
+        contact_value=otp.contact_value,
+        sms_provider=otp.sms_provider,
+        expires_at=otp.expires_at,
+        verified=otp.verified,
+        attempts=otp.attempts,
+        created_at=otp.created_at,
+    )
+
+
+def _log_sms_rejection(event: str, otp: OTPCode, cached: bool = False) -> None:
+    """Log a rejected SMS OTP verification."""
+    if otp.contact_method != "sms":
+        return
+    otp_sms_verify_logger.warning(
+        event,
+        extra={
+            "otp_id": otp.id,
+            "student_id": otp.student_id,
+            "contact_method": otp.contact_method,
+            "contact_value": _mask_contact_value(otp.contact_value),
+            "cached": cached,
+            "success": False,
+        },
+    )
+
+
+def _reject_terminal(otp: OTPCode, event: str, error_message: str) -> tuple[bool, str, OTPCode]:
+    """Log and remember a rejection that no later submission can overturn."""
+    _log_sms_rejection(event, otp)
+    _terminal_otp_cache.set(otp.id, (_otp_snapshot(otp), event, error_message))
+    return False, error_message, otp
+
+
 def generate_otp_code(length: int = None) -> str:
     """
     Generate a random OTP code
@@ -78,9 +123,10 @@ async def create_otp(
         attempts=0
     )
     
-    db.add(otp)
-    db.commit()
-    db.refresh(otp)
+    # Every attribute is set above, so skip the post-commit reload.
+    with no_expire_on_commit(db):
+        db.add(otp)
+        db.commit()
     
     return otp
 
@@ -101,8 +147,14 @@ async def verify_otp(
     Returns:
         tuple[bool, str, OTPCode]: (is_valid, error_message, otp_record)
     """
+    cached = _terminal_otp_cache.get(otp_id)
+    if cached is not None:
+        otp, event, error_message = cached
+        _log_sms_rejection(event, otp, cached=True)
+        return False, error_message, otp
+
     # Get OTP record
-    otp = db.query(OTPCode).filter(OTPCode.id == otp_id).first()
+    otp = db.get(OTPCode, otp_id)
     
     if not otp:
         otp_sms_verify_logger.warning(
@@ -126,56 +178,33 @@ async def verify_otp(
     
     # Check if already verified
     if otp.verified:
-        if otp.contact_method == "sms":
-            otp_sms_verify_logger.warning(
-                "otp_already_used",
-                extra={
-                    "otp_id": otp.id,
-                    "student_id": otp.student_id,
-                    "contact_method": otp.contact_method,
-                    "contact_value": _mask_contact_value(otp.contact_value),
-                    "success": False,
-                },
-            )
-        return False, "Ce code a déjà été utilisé", otp
+        return _reject_terminal(otp, "otp_already_used", "Ce code a déjà été utilisé")
     
     # Check if expired
     if datetime.utcnow() > otp.expires_at:
-        if otp.contact_method == "sms":
-            otp_sms_verify_logger.warning(
-                "otp_expired",
-                extra={
-                    "otp_id": otp.id,
-                    "student_id": otp.student_id,
-                    "contact_method": otp.contact_method,
-                    "contact_value": _mask_contact_value(otp.contact_value),
-                    "success": False,
-                },
-            )
-        return False, "Code OTP expiré. Veuillez demander un nouveau code", otp
+        return _reject_terminal(
+            otp, "otp_expired", "Code OTP expiré. Veuillez demander un nouveau code"
+        )
     
     # Check attempts
     if otp.attempts >= settings.OTP_MAX_ATTEMPTS:
-        if otp.contact_method == "sms":
-            otp_sms_verify_logger.warning(
-                "otp_max_attempts_reached",
-                extra={
-                    "otp_id": otp.id,
-                    "student_id": otp.student_id,
-                    "contact_method": otp.contact_method,
-                    "contact_value": _mask_contact_value(otp.contact_value),
-                    "success": False,
-                },
-            )
-        return False, "Nombre maximum de tentatives atteint. Veuillez demander un nouveau code", otp
+        return _reject_terminal(
+            otp,
+            "otp_max_attempts_reached",
+            "Nombre maximum de tentatives atteint. Veuillez demander un nouveau code",
+        )
     
-    # Increment attempts
-    otp.attempts += 1
-    db.commit()
+    # Rejections above are read-only; only a compared code is written,
+    # with the attempt count and verification flag in a single commit.
+    code_matches = otp.code == code
+    with no_expire_on_commit(db):
+        otp.attempts += 1
+        if code_matches:
+            otp.verified = True
+        db.commit()
     
     # Verify code
-    if otp.code != code:
-        db.commit()
+    if not code_matches:
         remaining = settings.OTP_MAX_ATTEMPTS - otp.attempts
         if otp.contact_method == "sms":
             otp_sms_verify_logger.warning(
@@ -190,11 +219,6 @@ async def verify_otp(
                 },
             )
         return False, f"Code incorrect. {remaining} tentative(s) restante(s)", otp
-    
-    # Mark as verified
-    otp.verified = True
-    db.commit()
-    db.refresh(otp)
 
     if otp.contact_method == "sms":
         otp_sms_verify_logger.info(
@@ -7,7 +7,7 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from reportlab.platypus import (
     SimpleDocTemplate, Table, TableStyle, Paragraph, 
-    Spacer, Image
+    Spacer, Image, PageBreak
 )
 from reportlab.lib.units import cm
 from reportlab.pdfgen import canvas
@@ -15,6 +15,7 @@ from io import BytesIO
 from datetime import datetime
 from typing import List, Dict
 from pathlib import Path
+from xml.sax.saxutils import escape as xml_escape
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,6 +23,9 @@ logger = logging.getLogger(__name__)
 
 LOGO_PATH = Path(__file__).resolve().parents[2] / "static" / "img" / "image.png"
 
+DEFAULT_SIGNATURE_NAME = "Stéphane Zoa "
+DEFAULT_SIGNATURE_TITLE = "Aspirant ingénieur en Informatique , stephanezoa.online copyright ©️ 2026"
+
 
 class NumberedCanvas(canvas.Canvas):
     """Custom canvas for page numbering"""
@@ -93,7 +97,7 @@ def append_logo(elements, width_cm=3.0, height_cm=3.0):
         elements.append(logo_table)
         elements.append(Spacer(1, 0.28 * cm))
     except Exception as e:
-        logger.warning(f"Failed to load logo: {e}")
+        logger.warning("Failed to load logo: %s", e)
 
 
 def generate_assignment_report(assignments: List[Dict]) -> BytesIO:
@@ -104,7 +108,7 @@ def generate_assignment_report(assignments: List[Dict]) -> BytesIO:
         if not assignments:
             raise ValueError("No assignments to generate report")
         
-        logger.info(f"Generating report for {len(assignments)} assignments")
+        logger.info("Generating report for %d assignments", len(assignments))
         
         buffer = BytesIO()
         doc = SimpleDocTemplate(
@@ -214,18 +218,19 @@ def generate_assignment_report(assignments: List[Dict]) -> BytesIO:
         ]]
         
         # Data rows - Paragraphs empêchent le débordement
-        for idx, a in enumerate(assignments, 1):
-            student_name = safe_str(a.get("student_name", "N/A"))
-            project = safe_str(a.get("project_title", "N/A"))
-            assigned_date = format_date(a.get("assigned_at", ""), "%d/%m/%Y")
-            
-            data.append([
+        names = [xml_escape(safe_str(a.get("student_name", "N/A"))) for a in assignments]
+        projects = [xml_escape(safe_str(a.get("project_title", "N/A"))) for a in assignments]
+        dates = [format_date(a.get("assigned_at", ""), "%d/%m/%Y") for a in assignments]
+        data.extend([
+            [
                 Paragraph(f"<b>{idx}</b>", cell_center_style),
-                Paragraph(student_name, cell_style),
+                Paragraph(name, cell_style),
                 Paragraph(project, cell_style),
-                Paragraph("", cell_center_style),  # Note vide
+                "",  # Note vide
                 Paragraph(assigned_date, cell_center_style)
-            ])
+            ]
+            for idx, (name, project, assigned_date) in enumerate(zip(names, projects, dates), 1)
+        ])
         
         # Largeurs optimisées (Total: 18cm)
         # N°=1cm, Étudiant=5.5cm, Projet=7cm, Note=2cm, Date=2.5cm
@@ -288,245 +293,306 @@ def generate_assignment_report(assignments: List[Dict]) -> BytesIO:
         return buffer
         
     except Exception as e:
-        logger.error(f"Error generating assignment report: {e}")
+        logger.error("Error generating assignment report: %s", e)
         raise
 
 
+def _build_certificate_doc(buffer: BytesIO, title: str) -> SimpleDocTemplate:
+    """Create the A4 document template shared by student certificates"""
+    return SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=2.5*cm,
+        leftMargin=2.5*cm,
+        topMargin=2.5*cm,
+        bottomMargin=3*cm,
+        title=title,
+        author="Institut Africain d'Informatique"
+    )
+
+
+def _build_certificate_flowables(
+    student_name: str,
+    student_matricule: str,
+    project_title: str,
+    project_description: str,
+    assigned_at: str,
+    signature_name: str = DEFAULT_SIGNATURE_NAME,
+    signature_title: str = DEFAULT_SIGNATURE_TITLE
+) -> list:
+    """
+    Build the flowables of one student certificate
+    """
+    if not all([student_name, student_matricule, project_title]):
+        raise ValueError("Missing required fields")
+
+    styles = getSampleStyleSheet()
+    elements = []
+
+    # Styles
+    title_style = ParagraphStyle(
+        "CertTitle",
+        parent=styles["Heading1"],
+        fontSize=20,
+        textColor=colors.HexColor("#1e3a8a"),
+        alignment=TA_CENTER,
+        spaceAfter=6,
+        fontName='Helvetica-Bold',
+        leading=24
+    )
+    
+    subtitle_style = ParagraphStyle(
+        "CertSubtitle",
+        parent=styles["Normal"],
+        fontSize=11,
+        textColor=colors.HexColor("#374151"),
+        alignment=TA_CENTER,
+        spaceAfter=18,
+        fontName='Helvetica'
+    )
+    
+    section_style = ParagraphStyle(
+        "Section",
+        parent=styles["Heading3"],
+        fontSize=12,
+        textColor=colors.HexColor("#1e3a8a"),
+        spaceAfter=8,
+        spaceBefore=10,
+        fontName='Helvetica-Bold'
+    )
+    
+    body_style = ParagraphStyle(
+        "Body",
+        parent=styles["Normal"],
+        fontSize=10,
+        leading=14,
+        textColor=colors.HexColor("#111827"),
+        alignment=TA_JUSTIFY,
+        fontName='Helvetica'
+    )
+    
+    highlight_style = ParagraphStyle(
+        "Highlight",
+        parent=body_style,
+        fontSize=11,
+        fontName='Helvetica-Bold',
+        textColor=colors.HexColor("#1e3a8a"),
+        alignment=TA_LEFT
+    )
+
+    # Header
+    append_logo(elements, width_cm=2, height_cm=2)
+    elements.append(Paragraph("Institut Africain d'Informatique", title_style))
+    elements.append(Paragraph("Yaoundé - Cameroun", subtitle_style))
+    elements.append(Spacer(1, 0.2*cm))
+    
+    # Title box
+    cert_title = Paragraph("ATTESTATION D'ATTRIBUTION DE THÈME", title_style)
+    cert_subtitle = Paragraph("Licence 3 - Génie Logiciel", subtitle_style)
+    
+    title_data = [[cert_title], [cert_subtitle]]
+    title_table = Table(title_data, colWidths=[A4[0] - 5*cm])
+    title_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor("#eff6ff")),
+        ('BORDER', (0, 0), (-1, -1), 2, colors.HexColor("#1e3a8a")),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('TOPPADDING', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ]))
+    elements.append(title_table)
+    elements.append(Spacer(1, 0.4*cm))
+
+    # Date formatting
+    try:
+        dt = datetime.fromisoformat(assigned_at.replace('Z', '+00:00'))
+        date_label = dt.strftime("%d/%m/%Y à %H:%M")
+    except Exception:
+        date_label = safe_str(assigned_at)
+
+    # Student info with Paragraph for wrapping
+    student_data = [
+        ["Étudiant(e)", Paragraph(safe_str(student_name), body_style)],
+        ["Matricule", Paragraph(safe_str(student_matricule), body_style)],
+        ["Date d'attribution", Paragraph(date_label, body_style)],
+        ["Date d'édition", Paragraph(datetime.now().strftime("%d/%m/%Y"), body_style)],
+        ["Année académique", Paragraph(datetime.now().strftime("%Y"), body_style)],
+    ]
+    
+    student_table = Table(student_data, colWidths=[4*cm, A4[0] - 9*cm])
+    student_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor("#f3f4f6")),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor("#d1d5db")),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('LEFTPADDING', (0, 0), (-1, -1), 10),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ]))
+    elements.append(student_table)
+    elements.append(Spacer(1, 0.5*cm))
+
+    # Project with wrapping
+    elements.append(Paragraph("Thème attribué", section_style))
+    
+    project_para = Paragraph(f"<b>{safe_str(project_title)}</b>", highlight_style)
+    project_box = Table([[project_para]], colWidths=[A4[0] - 5*cm])
+    project_box.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor("#dbeafe")),
+        ('BORDER', (0, 0), (-1, -1), 1, colors.HexColor("#3b82f6")),
+        ('TOPPADDING', (0, 0), (-1, -1), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ('LEFTPADDING', (0, 0), (-1, -1), 12),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+    ]))
+    elements.append(project_box)
+    elements.append(Spacer(1, 0.3*cm))
+
+    # Description with wrapping
+    elements.append(Paragraph("Description du projet", section_style))
+    
+    desc_para = Paragraph(safe_str(project_description or "Aucune description fournie."), body_style)
+    desc_box = Table([[desc_para]], colWidths=[A4[0] - 5*cm])
+    desc_box.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor("#f9fafb")),
+        ('BORDER', (0, 0), (-1, -1), 0.5, colors.HexColor("#e5e7eb")),
+        ('TOPPADDING', (0, 0), (-1, -1), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ('LEFTPADDING', (0, 0), (-1, -1), 12),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+    ]))
+    elements.append(desc_box)
+    elements.append(Spacer(1, 0.8*cm))
+
+    # Note
+    note_style = ParagraphStyle(
+        'Note',
+        parent=body_style,
+        fontSize=9,
+        textColor=colors.HexColor("#dc2626"),
+        leading=12
+    )
+    note_text = """
+    <b>Note importante:</b> Ce thème vous est attribué de manière définitive. 
+    Toute modification devra faire l'objet d'une demande écrite.
+    """
+    note_para = Paragraph(note_text, note_style)
+    note_box = Table([[note_para]], colWidths=[A4[0] - 5*cm])
+    note_box.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor("#fef2f2")),
+        ('BORDER', (0, 0), (-1, -1), 1, colors.HexColor("#dc2626")),
+        ('TOPPADDING', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+        ('LEFTPADDING', (0, 0), (-1, -1), 10),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ]))
+    elements.append(note_box)
+    elements.append(Spacer(1, 1*cm))
+
+    # Signature
+    sig_style = ParagraphStyle(
+        'Sig',
+        parent=body_style,
+        fontSize=10,
+        alignment=TA_CENTER
+    )
+    
+    sig_name_style = ParagraphStyle(
+        'SigName',
+        parent=sig_style,
+        fontName='Helvetica-Bold',
+        fontSize=11,
+        textColor=colors.HexColor("#1e3a8a")
+    )
+    
+    current_date = datetime.now().strftime("Fait à Yaoundé, le %d/%m/%Y")
+    
+    sig_data = [
+        [Paragraph(current_date, sig_style)],
+        [Spacer(1, 0.3*cm)],
+        [Paragraph(safe_str(signature_name), sig_name_style)],
+        [Paragraph(safe_str(signature_title), sig_style)],
+    ]
+    
+    sig_table = Table(sig_data, colWidths=[A4[0] - 5*cm])
+    sig_table.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ]))
+    elements.append(sig_table)
+
+    return elements
+
+
 def generate_student_theme_pdf(
     student_name: str,
     student_matricule: str,
     project_title: str,
     project_description: str,
     assigned_at: str,
-    signature_name: str = "Stéphane Zoa ",
-    signature_title: str = "Aspirant ingénieur en Informatique , stephanezoa.online copyright ©️ 2026"
+    signature_name: str = DEFAULT_SIGNATURE_NAME,
+    signature_title: str = DEFAULT_SIGNATURE_TITLE
 ) -> BytesIO:
     """
     Generate professional student certificate with proper text wrapping
     """
     try:
-        if not all([student_name, student_matricule, project_title]):
-            raise ValueError("Missing required fields")
-        
-        logger.info(f"Generating certificate for {student_name}")
-        
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=2.5*cm,
-            leftMargin=2.5*cm,
-            topMargin=2.5*cm,
-            bottomMargin=3*cm,
-            title=f"Attribution - {student_name}",
-            author="Institut Africain d'Informatique"
-        )
-
-        styles = getSampleStyleSheet()
-        elements = []
-
-        # Styles
-        title_style = ParagraphStyle(
-            "CertTitle",
-            parent=styles["Heading1"],
-            fontSize=20,
-            textColor=colors.HexColor("#1e3a8a"),
-            alignment=TA_CENTER,
-            spaceAfter=6,
-            fontName='Helvetica-Bold',
-            leading=24
-        )
-        
-        subtitle_style = ParagraphStyle(
-            "CertSubtitle",
-            parent=styles["Normal"],
-            fontSize=11,
-            textColor=colors.HexColor("#374151"),
-            alignment=TA_CENTER,
-            spaceAfter=18,
-            fontName='Helvetica'
-        )
-        
-        section_style = ParagraphStyle(
-            "Section",
-            parent=styles["Heading3"],
-            fontSize=12,
-            textColor=colors.HexColor("#1e3a8a"),
-            spaceAfter=8,
-            spaceBefore=10,
-            fontName='Helvetica-Bold'
-        )
-        
-        body_style = ParagraphStyle(
-            "Body",
-            parent=styles["Normal"],
-            fontSize=10,
-            leading=14,
-            textColor=colors.HexColor("#111827"),
-            alignment=TA_JUSTIFY,
-            fontName='Helvetica'
-        )
-        
-        highlight_style = ParagraphStyle(
-            "Highlight",
-            parent=body_style,
-            fontSize=11,
-            fontName='Helvetica-Bold',
-            textColor=colors.HexColor("#1e3a8a"),
-            alignment=TA_LEFT
+        logger.info("Generating certificate for %s", student_name)
+        
+        elements = _build_certificate_flowables(
+            student_name=student_name,
+            student_matricule=student_matricule,
+            project_title=project_title,
+            project_description=project_description,
+            assigned_at=assigned_at,
+            signature_name=signature_name,
+            signature_title=signature_title,
         )
 
-        # Header
-        append_logo(elements, width_cm=2, height_cm=2)
-        elements.append(Paragraph("Institut Africain d'Informatique", title_style))
-        elements.append(Paragraph("Yaoundé - Cameroun", subtitle_style))
-        elements.append(Spacer(1, 0.2*cm))
+        buffer = BytesIO()
+        doc = _build_certificate_doc(buffer, f"Attribution - {student_name}")
+        doc.build(elements)
+        buffer.seek(0)
         
-        # Title box
-        cert_title = Paragraph("ATTESTATION D'ATTRIBUTION DE THÈME", title_style)
-        cert_subtitle = Paragraph("Licence 3 - Génie Logiciel", subtitle_style)
+        logger.info("Certificate generated for %s", student_name)
+        return buffer
         
-        title_data = [[cert_title], [cert_subtitle]]
-        title_table = Table(title_data, colWidths=[A4[0] - 5*cm])
-        title_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor("#eff6ff")),
-            ('BORDER', (0, 0), (-1, -1), 2, colors.HexColor("#1e3a8a")),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]))
-        elements.append(title_table)
-        elements.append(Spacer(1, 0.4*cm))
+    except Exception as e:
+        logger.error("Error generating certificate: %s", e)
+        raise
 
-        # Date formatting
-        try:
-            dt = datetime.fromisoformat(assigned_at.replace('Z', '+00:00'))
-            date_label = dt.strftime("%d/%m/%Y à %H:%M")
-        except Exception:
-            date_label = safe_str(assigned_at)
-
-        # Student info with Paragraph for wrapping
-        student_data = [
-            ["Étudiant(e)", Paragraph(safe_str(student_name), body_style)],
-            ["Matricule", Paragraph(safe_str(student_matricule), body_style)],
-            ["Date d'attribution", Paragraph(date_label, body_style)],
-            ["Date d'édition", Paragraph(datetime.now().strftime("%d/%m/%Y"), body_style)],
-            ["Année académique", Paragraph(datetime.now().strftime("%Y"), body_style)],
-        ]
-        
-        student_table = Table(student_data, colWidths=[4*cm, A4[0] - 9*cm])
-        student_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor("#f3f4f6")),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor("#d1d5db")),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ]))
-        elements.append(student_table)
-        elements.append(Spacer(1, 0.5*cm))
 
-        # Project with wrapping
-        elements.append(Paragraph("Thème attribué", section_style))
-        
-        project_para = Paragraph(f"<b>{safe_str(project_title)}</b>", highlight_style)
-        project_box = Table([[project_para]], colWidths=[A4[0] - 5*cm])
-        project_box.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor("#dbeafe")),
-            ('BORDER', (0, 0), (-1, -1), 1, colors.HexColor("#3b82f6")),
-            ('TOPPADDING', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-        ]))
-        elements.append(project_box)
-        elements.append(Spacer(1, 0.3*cm))
+def generate_student_theme_pdfs_bulk(students: List[Dict]) -> BytesIO:
+    """
+    Generate the certificates of several students in a single document
 
-        # Description with wrapping
-        elements.append(Paragraph("Description du projet", section_style))
-        
-        desc_para = Paragraph(safe_str(project_description or "Aucune description fournie."), body_style)
-        desc_box = Table([[desc_para]], colWidths=[A4[0] - 5*cm])
-        desc_box.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor("#f9fafb")),
-            ('BORDER', (0, 0), (-1, -1), 0.5, colors.HexColor("#e5e7eb")),
-            ('TOPPADDING', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-        ]))
-        elements.append(desc_box)
-        elements.append(Spacer(1, 0.8*cm))
+    Each item holds the keyword arguments of generate_student_theme_pdf.
+    Certificates are separated by page breaks and built in a single pass.
+    """
+    try:
+        if not students:
+            raise ValueError("No students to generate certificates for")
 
-        # Note
-        note_style = ParagraphStyle(
-            'Note',
-            parent=body_style,
-            fontSize=9,
-            textColor=colors.HexColor("#dc2626"),
-            leading=12
-        )
-        note_text = """
-        <b>Note importante:</b> Ce thème vous est attribué de manière définitive. 
-        Toute modification devra faire l'objet d'une demande écrite.
-        """
-        note_para = Paragraph(note_text, note_style)
-        note_box = Table([[note_para]], colWidths=[A4[0] - 5*cm])
-        note_box.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor("#fef2f2")),
-            ('BORDER', (0, 0), (-1, -1), 1, colors.HexColor("#dc2626")),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ]))
-        elements.append(note_box)
-        elements.append(Spacer(1, 1*cm))
+        logger.info("Generating %d certificates", len(students))
 
-        # Signature
-        sig_style = ParagraphStyle(
-            'Sig',
-            parent=body_style,
-            fontSize=10,
-            alignment=TA_CENTER
-        )
-        
-        sig_name_style = ParagraphStyle(
-            'SigName',
-            parent=sig_style,
-            fontName='Helvetica-Bold',
-            fontSize=11,
-            textColor=colors.HexColor("#1e3a8a")
-        )
-        
-        current_date = datetime.now().strftime("Fait à Yaoundé, le %d/%m/%Y")
-        
-        sig_data = [
-            [Paragraph(current_date, sig_style)],
-            [Spacer(1, 0.3*cm)],
-            [Paragraph(safe_str(signature_name), sig_name_style)],
-            [Paragraph(safe_str(signature_title), sig_style)],
-        ]
-        
-        sig_table = Table(sig_data, colWidths=[A4[0] - 5*cm])
-        sig_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ]))
-        elements.append(sig_table)
+        elements = []
+        for idx, student in enumerate(students):
+            if idx:
+                elements.append(PageBreak())
+            elements.extend(_build_certificate_flowables(**student))
 
+        buffer = BytesIO()
+        doc = _build_certificate_doc(buffer, "Attestations d'attribution - GL3E")
         doc.build(elements)
         buffer.seek(0)
-        
-        logger.info(f"Certificate generated for {student_name}")
+
+        logger.info("%d certificates generated", len(students))
         return buffer
-        
+
     except Exception as e:
-        logger.error(f"Error generating certificate: {e}")
+        logger.error("Error generating certificates: %s", e)
         raise
 
 
-__all__ = ['generate_assignment_report', 'generate_student_theme_pdf']
+__all__ = ['generate_assignment_report', 'generate_student_theme_pdf', 'generate_student_theme_pdfs_bulk']
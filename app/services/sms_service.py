@@ -4,18 +4,22 @@ Advanced SMS service with mTarget primary provider and Twilio fallback.
 from __future__ import annotations
 
 import asyncio
+import functools
+import logging
 import re
 import time
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass
+from enum import Enum
 from threading import Lock
 from typing import Any, Optional
+from urllib.parse import quote_plus, urlencode
 
 import httpx
-from twilio.rest import Client
-from twilio.base.exceptions import TwilioRestException
 
 from app.config import settings
-from app.logging_config import get_service_logger
+from app.logging_config import bind_logger, get_service_logger
 from app.utils.phone_validator import normalize_cameroon_phone
 
 # Defaults
@@ -27,8 +31,68 @@ DEFAULT_CIRCUIT_TIMEOUT_SECONDS = 60.0
 DEFAULT_TWILIO_TIMEOUT_SECONDS = 20.0
 DEFAULT_RATE_LIMIT_REQUESTS = 100
 DEFAULT_RATE_LIMIT_WINDOW_SECONDS = 60.0
+# Lowercase markers of an mTarget business error in an HTTP 200 body.
+MTARGET_ERROR_MARKERS = (b"error", b"ko")
+TWILIO_MESSAGES_URL = "https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
 
-logger = get_service_logger("sms")
+SMS_PROVIDERS = ("mtarget", "twilio")
+METRICS_EMA_ALPHA = 0.1
+# Upper bounds of the send duration histogram buckets; a final bucket holds the overflow.
+METRICS_DURATION_BOUNDS_MS = (0, 50, 100, 200, 500, 1000, 2000, 5000)
+METRICS_QUANTILES = (0.5, 0.95, 0.99)
+
+# Phone parsing helpers, compiled once at import.
+_E164_RE = re.compile(r"\+\d{10,15}")
+_NONDIGIT_RE = re.compile(r"\D")
+_PHONE_STRIP = str.maketrans("", "", " -()")
+_MTARGET_STRIP = str.maketrans("", "", " -")
+
+
+@functools.lru_cache(maxsize=1024)
+def _mask_phone(phone: str) -> str:
+    return f"{phone[:8]}***" if phone else "***"
+
+
+class _PhoneKind(Enum):
+    """Prefix class of a phone number, shared by routing and normalization."""
+
+    CM_PLUS237 = "cm_plus237"
+    CM_00237 = "cm_00237"
+    CM_237 = "cm_237"
+    CM_LOCAL = "cm_local"
+    OTHER = "other"
+
+
+def _classify_phone(phone_number: str) -> tuple[_PhoneKind, str]:
+    """
+    Classify a phone number by prefix in a single pass.
+
+    Returns:
+        The prefix kind and the number with spaces and dashes removed.
+    """
+    clean = (phone_number or "").strip().translate(_MTARGET_STRIP)
+    if clean.startswith("+237"):
+        return _PhoneKind.CM_PLUS237, clean
+    if clean.startswith("00237"):
+        return _PhoneKind.CM_00237, clean
+    if clean.startswith("237"):
+        return _PhoneKind.CM_237, clean
+    if clean[:1] == "6" and len(clean) == 9:
+        return _PhoneKind.CM_LOCAL, clean
+    return _PhoneKind.OTHER, clean
+
+
+@dataclass(frozen=True)
+class _ParsedPhone:
+    """Routing decision and provider formats for one recipient, parsed once per send."""
+
+    is_cameroon: bool
+    mtarget_form: str
+    e164_form: Optional[str]
+    e164_error: Optional[str] = None
+
+
+logger = bind_logger(get_service_logger("sms"), channel="sms")
 
 
 @dataclass
@@ -57,108 +121,161 @@ class SMSServiceConfig:
 
 
 class CircuitBreaker:
-    """Simple circuit breaker for provider calls."""
+    """Simple circuit breaker for provider calls.
+
+    The closed state is read without locking: state is a single reference
+    swap and sends run on the event loop thread. The lock only guards state
+    transitions.
+    """
 
     def __init__(self, threshold: int, timeout_seconds: float) -> None:
         self._threshold = threshold
-        self._timeout_seconds = timeout_seconds
+        self._timeout_ns = int(timeout_seconds * 1_000_000_000)
         self._failure_count = 0
-        self._last_failure_time = 0.0
+        self._last_failure_ns = 0
         self._state = "closed"  # closed | open | half-open
         self._lock = Lock()
 
     def can_attempt(self) -> bool:
+        if self._state == "closed":
+            return True
         with self._lock:
-            if self._state == "closed":
-                return True
             if self._state == "open":
-                if (time.monotonic() - self._last_failure_time) > self._timeout_seconds:
+                if (time.monotonic_ns() - self._last_failure_ns) > self._timeout_ns:
                     self._state = "half-open"
                     return True
                 return False
-            return True  # half-open
+            return True  # closed or half-open
 
     def record_success(self) -> None:
+        if self._state == "closed" and self._failure_count == 0:
+            return
         with self._lock:
             self._failure_count = 0
             if self._state == "half-open":
                 self._state = "closed"
 
     def record_failure(self) -> None:
-        with self._lock:
-            self._failure_count += 1
-            self._last_failure_time = time.monotonic()
-            if self._failure_count >= self._threshold:
+        self._failure_count += 1
+        self._last_failure_ns = time.monotonic_ns()
+        if self._failure_count >= self._threshold and self._state != "open":
+            with self._lock:
                 self._state = "open"
 
     def state(self) -> str:
-        with self._lock:
-            return self._state
+        return self._state
 
 
 class RateLimiter:
-    """In-memory sliding-window rate limiter."""
+    """In-memory sliding-window-counter rate limiter.
+
+    Keeps request counts for the current and previous fixed windows and
+    weights the previous one by how much of it still overlaps the sliding
+    window, so memory and per-call cost stay constant.
+    """
 
     def __init__(self, max_requests: int, window_seconds: float) -> None:
         self._max_requests = max_requests
-        self._window_seconds = window_seconds
-        self._timestamps: list[float] = []
+        self._window_ns = max(1, int(window_seconds * 1_000_000_000))
+        self._current_bucket = 0
+        self._curr_count = 0
+        self._prev_count = 0
         self._lock = Lock()
 
     def allow(self) -> bool:
-        now = time.monotonic()
-        cutoff = now - self._window_seconds
+        now = time.monotonic_ns()
+        bucket, elapsed_ns = divmod(now, self._window_ns)
+        elapsed_ratio = elapsed_ns / self._window_ns
         with self._lock:
-            self._timestamps = [ts for ts in self._timestamps if ts > cutoff]
-            if len(self._timestamps) >= self._max_requests:
+            if bucket != self._current_bucket:
+                self._prev_count = self._curr_count if bucket == self._current_bucket + 1 else 0
+                self._curr_count = 0
+                self._current_bucket = bucket
+            estimated = self._prev_count * (1.0 - elapsed_ratio) + self._curr_count
+            if estimated >= self._max_requests:
                 return False
-            self._timestamps.append(now)
+            self._curr_count += 1
             return True
 
 
 class SMSMetrics:
-    """Simple in-memory metrics snapshot."""
+    """Simple in-memory metrics snapshot.
+
+    Counters are bumped without locking: sends run on the event loop thread and
+    provider keys are created up front, so each update is a plain int store.
+    The average duration is an EMA written as a single float assignment, and
+    per-provider durations are also counted into fixed histogram buckets.
+    snapshot() reads the same fields without locking, so its values are
+    best-effort rather than an atomic copy.
+    """
 
     def __init__(self) -> None:
-        self._lock = Lock()
         self.total_sent = 0
         self.total_failed = 0
         self.total_retries = 0
-        self.sent_by_provider: dict[str, int] = {}
-        self.failed_by_provider: dict[str, int] = {}
+        self.sent_by_provider: dict[str, int] = dict.fromkeys(SMS_PROVIDERS, 0)
+        self.failed_by_provider: dict[str, int] = dict.fromkeys(SMS_PROVIDERS, 0)
         self.avg_duration_ms = 0.0
+        self._duration_seeded = False
+        self.duration_buckets: dict[str, array] = {
+            provider: array("Q", [0] * (len(METRICS_DURATION_BOUNDS_MS) + 1)) for provider in SMS_PROVIDERS
+        }
 
     def record_success(self, provider: str, duration_ms: float) -> None:
-        with self._lock:
-            self.total_sent += 1
-            self.sent_by_provider[provider] = self.sent_by_provider.get(provider, 0) + 1
-            if self.avg_duration_ms == 0:
-                self.avg_duration_ms = duration_ms
-            else:
-                self.avg_duration_ms = (self.avg_duration_ms * 0.9) + (duration_ms * 0.1)
+        self.total_sent += 1
+        self.sent_by_provider[provider] += 1
+        self.duration_buckets[provider][bisect_left(METRICS_DURATION_BOUNDS_MS, duration_ms)] += 1
+        if self._duration_seeded:
+            self.avg_duration_ms = (
+                self.avg_duration_ms * (1.0 - METRICS_EMA_ALPHA) + duration_ms * METRICS_EMA_ALPHA
+            )
+        else:
+            self.avg_duration_ms = duration_ms
+            self._duration_seeded = True
 
     def record_failure(self, provider: str) -> None:
-        with self._lock:
-            self.total_failed += 1
-            self.failed_by_provider[provider] = self.failed_by_provider.get(provider, 0) + 1
+        self.total_failed += 1
+        self.failed_by_provider[provider] += 1
 
     def record_retry(self) -> None:
-        with self._lock:
-            self.total_retries += 1
+        self.total_retries += 1
 
     def snapshot(self) -> dict[str, Any]:
-        with self._lock:
-            total = self.total_sent + self.total_failed
-            success_rate = (self.total_sent / total * 100.0) if total > 0 else 0.0
-            return {
-                "total_sent": self.total_sent,
-                "total_failed": self.total_failed,
-                "total_retries": self.total_retries,
-                "success_rate_percent": round(success_rate, 2),
-                "average_duration_ms": round(self.avg_duration_ms, 2),
-                "sent_by_provider": dict(self.sent_by_provider),
-                "failed_by_provider": dict(self.failed_by_provider),
-            }
+        """Best-effort copy of the counters, read on the event loop thread."""
+        total = self.total_sent + self.total_failed
+        success_rate = (self.total_sent / total * 100.0) if total > 0 else 0.0
+        return {
+            "total_sent": self.total_sent,
+            "total_failed": self.total_failed,
+            "total_retries": self.total_retries,
+            "success_rate_percent": round(success_rate, 2),
+            "average_duration_ms": round(self.avg_duration_ms, 2),
+            "sent_by_provider": dict(self.sent_by_provider),
+            "failed_by_provider": dict(self.failed_by_provider),
+            "duration_buckets_ms": {
+                provider: buckets.tolist() for provider, buckets in self.duration_buckets.items()
+            },
+        }
+
+
+def _histogram_quantile(counts: list[int], quantile: float) -> Optional[int]:
+    """
+    Estimate a quantile from duration bucket counts.
+
+    Returns:
+        Upper bound of the bucket holding the quantile (the last bound for the
+        overflow bucket), or None when there are no samples.
+    """
+    total = sum(counts)
+    if not total:
+        return None
+    rank = quantile * total
+    seen = 0
+    for index, count in enumerate(counts):
+        seen += count
+        if seen >= rank:
+            return METRICS_DURATION_BOUNDS_MS[min(index, len(METRICS_DURATION_BOUNDS_MS) - 1)]
+    return METRICS_DURATION_BOUNDS_MS[-1]
 
 
 class SMSService:
@@ -191,21 +308,45 @@ class SMSService:
         )
         self.metrics = SMSMetrics()
 
-        self.twilio_client: Optional[Client] = None
-        if self.config.twilio_account_sid and self.config.twilio_auth_token:
-            self.twilio_client = Client(
+        # Static part of every mTarget request, built once.
+        self._mtarget_sender = (self.config.mtarget_sender or "FM OTP").strip()
+        self._mtarget_static_body = urlencode(
+            {
+                "username": self.config.mtarget_username,
+                "password": self.config.mtarget_password,
+                "service_id": self.config.mtarget_service_id,
+                "sender": self._mtarget_sender,
+            }
+        ).encode()
+        self._mtarget_headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        self._mtarget_endpoint = httpx.URL(self.config.mtarget_url)
+
+        # Pooled client shared by both providers to keep connections warm.
+        self._http_client = httpx.AsyncClient(
+            timeout=self.config.timeout_seconds,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+
+        # Twilio is called through its REST API on the shared client.
+        self.twilio_configured = bool(self.config.twilio_account_sid and self.config.twilio_auth_token)
+        self._twilio_auth: Optional[httpx.BasicAuth] = None
+        self._twilio_endpoint: Optional[httpx.URL] = None
+        if self.twilio_configured:
+            self._twilio_auth = httpx.BasicAuth(
                 self.config.twilio_account_sid,
                 self.config.twilio_auth_token,
             )
+            self._twilio_endpoint = httpx.URL(
+                TWILIO_MESSAGES_URL.format(account_sid=self.config.twilio_account_sid)
+            )
 
         logger.info(
             "sms_service_initialized",
             extra={
-                "channel": "sms",
                 "mtarget_configured": bool(
                     self.config.mtarget_username and self.config.mtarget_password
                 ),
-                "twilio_configured": bool(self.twilio_client),
+                "twilio_configured": self.twilio_configured,
                 "max_retries": self.config.max_retries,
                 "timeout_seconds": self.config.timeout_seconds,
                 "circuit_threshold": self.config.circuit_threshold,
@@ -214,34 +355,31 @@ class SMSService:
             },
         )
 
-    @staticmethod
-    def _mask_phone(phone: str) -> str:
-        return f"{phone[:8]}***" if phone else "***"
-
     @staticmethod
     def _is_valid_e164(phone_number: str) -> bool:
         clean = (phone_number or "").strip()
         if not clean.startswith("+"):
             return False
-        if not re.fullmatch(r"\+\d{10,15}", clean):
-            return False
-        return True
+        return _E164_RE.fullmatch(clean) is not None
 
-    @staticmethod
-    def _is_cameroon_number(phone_number: str) -> bool:
-        clean = (phone_number or "").strip().replace(" ", "").replace("-", "")
-        return (
-            clean.startswith("+237")
-            or clean.startswith("00237")
-            or clean.startswith("237")
-            or (clean.startswith("6") and len(clean) == 9)
-        )
-
-    def _normalize_phone_for_mtarget(self, phone_number: str) -> str:
+    def _normalize_phone_for_mtarget(
+        self,
+        phone_number: str,
+        classified: Optional[tuple[_PhoneKind, str]] = None,
+    ) -> str:
         """
         Normalize to mTarget expected format: 00237XXXXXXXXX.
         """
-        clean = (phone_number or "").strip().replace(" ", "").replace("-", "")
+        kind, clean = classified or _classify_phone(phone_number)
+        if kind is _PhoneKind.CM_00237:
+            return clean
+        if kind is _PhoneKind.CM_PLUS237:
+            return f"00{clean[1:]}"
+        if kind is _PhoneKind.CM_237:
+            return f"00{clean}"
+        if kind is _PhoneKind.CM_LOCAL:
+            return f"00237{clean}"
+
         if clean.startswith("+"):
             clean = clean[1:]
         if clean.startswith("00237"):
@@ -251,14 +389,27 @@ class SMSService:
         if clean.startswith("6") and len(clean) == 9:
             return f"00237{clean}"
         # fallback keeps numeric chars only; provider will reject if invalid
-        return re.sub(r"\D", "", clean)
+        return _NONDIGIT_RE.sub("", clean)
 
-    def _normalize_phone_for_twilio(self, phone_number: str) -> str:
+    def _normalize_phone_for_twilio(
+        self,
+        phone_number: str,
+        classified: Optional[tuple[_PhoneKind, str]] = None,
+    ) -> str:
         """
         Normalize to E.164 for Twilio.
         """
-        clean = (phone_number or "").strip().replace(" ", "").replace("-", "").replace("(", "").replace(")", "")
-        if clean.startswith("00"):
+        kind, clean = classified or _classify_phone(phone_number)
+        if "(" in clean or ")" in clean:
+            kind, clean = _PhoneKind.OTHER, clean.translate(_PHONE_STRIP)
+
+        if kind is _PhoneKind.CM_PLUS237:
+            pass
+        elif kind is _PhoneKind.CM_00237:
+            clean = f"+{clean[2:]}"
+        elif kind is _PhoneKind.CM_LOCAL:
+            clean = f"+237{clean}"
+        elif clean.startswith("00"):
             clean = f"+{clean[2:]}"
         elif clean.startswith("237") and len(clean) == 12:
             clean = f"+{clean}"
@@ -285,28 +436,49 @@ class SMSService:
             return "https://api-public-2.mtarget.fr/messages"
         return cleaned
 
-    async def _send_via_mtarget_once(self, phone: str, message: str) -> dict[str, Any]:
-        sender = (self.config.mtarget_sender or "FM OTP").strip()
-        normalized_phone = self._normalize_phone_for_mtarget(phone)
-        payload = {
-            "username": self.config.mtarget_username,
-            "password": self.config.mtarget_password,
-            "msisdn": normalized_phone,
-            "msg": message,
-            "service_id": self.config.mtarget_service_id,
-            "sender": sender,
-        }
+    def _parse_phone(self, phone_number: str) -> _ParsedPhone:
+        """
+        Classify a recipient and build both provider formats in one pass.
 
-        start = time.perf_counter()
+        Args:
+            phone_number: Recipient number as entered
+
+        Returns:
+            Parsed phone; e164_form is None with e164_error set when Twilio cannot use it
+        """
+        classified = _classify_phone(phone_number)
         try:
-            async with httpx.AsyncClient(timeout=self.config.timeout_seconds) as client:
-                response = await client.post(
-                    self.config.mtarget_url,
-                    data=payload,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
+            e164_form: Optional[str] = self._normalize_phone_for_twilio(phone_number, classified)
+            e164_error = None
+        except ValueError as exc:
+            e164_form, e164_error = None, str(exc)
+        return _ParsedPhone(
+            is_cameroon=classified[0] is not _PhoneKind.OTHER,
+            mtarget_form=self._normalize_phone_for_mtarget(phone_number, classified),
+            e164_form=e164_form,
+            e164_error=e164_error,
+        )
+
+    async def _send_via_mtarget_once(self, normalized_phone: str, message: str) -> dict[str, Any]:
+        body = b"".join(
+            (
+                self._mtarget_static_body,
+                b"&msisdn=",
+                quote_plus(normalized_phone).encode(),
+                b"&msg=",
+                quote_plus(message).encode(),
+            )
+        )
+
+        start = time.perf_counter_ns()
+        try:
+            response = await self._http_client.post(
+                self._mtarget_endpoint,
+                content=body,
+                headers=self._mtarget_headers,
+            )
         except Exception as exc:
-            duration_ms = round((time.perf_counter() - start) * 1000.0, 2)
+            duration_ms = round((time.perf_counter_ns() - start) / 1_000_000, 2)
             err = f"mTarget exception {type(exc).__name__}: {repr(exc)}"
             return {
                 "success": False,
@@ -315,16 +487,19 @@ class SMSService:
                 "duration_ms": duration_ms,
                 "normalized_phone": normalized_phone,
             }
-        duration_ms = round((time.perf_counter() - start) * 1000.0, 2)
+        duration_ms = round((time.perf_counter_ns() - start) / 1_000_000, 2)
 
         if response.status_code == 200:
-            response_text = (response.text or "").strip()
+            content = response.content.strip()
+            encoding = response.encoding or "utf-8"
             # mTarget can return HTTP 200 with business error in body.
-            if "error" in response_text.lower() or "ko" in response_text.lower():
+            lowered = content.lower()
+            if any(marker in lowered for marker in MTARGET_ERROR_MARKERS):
+                preview = content[:250].decode(encoding, errors="replace")
                 return {
                     "success": False,
                     "provider": "mtarget",
-                    "error": f"mTarget business error: {response_text[:250]}",
+                    "error": f"mTarget business error: {preview}",
                     "duration_ms": duration_ms,
                 }
             return {
@@ -332,8 +507,9 @@ class SMSService:
                 "provider": "mtarget",
                 "error": None,
                 "duration_ms": duration_ms,
-                "sender": sender,
-                "response_preview": response_text[:250],
+                "sender": self._mtarget_sender,
+                # Only the preview is decoded, never the whole body
+                "response_preview": content[:250].decode(encoding, errors="replace"),
                 "normalized_phone": normalized_phone,
             }
         return {
@@ -344,8 +520,8 @@ class SMSService:
             "normalized_phone": normalized_phone,
         }
 
-    async def _send_via_twilio_once(self, phone: str, message: str) -> dict[str, Any]:
-        if not self.twilio_client:
+    async def _send_via_twilio_once(self, twilio_phone: str, message: str) -> dict[str, Any]:
+        if not self.twilio_configured:
             return {
                 "success": False,
                 "provider": "twilio",
@@ -353,29 +529,16 @@ class SMSService:
                 "duration_ms": 0.0,
             }
 
+        start = time.perf_counter_ns()
         try:
-            twilio_phone = self._normalize_phone_for_twilio(phone)
-        except ValueError as exc:
-            return {
-                "success": False,
-                "provider": "twilio",
-                "error": str(exc),
-                "duration_ms": 0.0,
-            }
-
-        start = time.perf_counter()
-        try:
-            message_obj = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self.twilio_client.messages.create,
-                    body=message,
-                    from_=self.config.twilio_phone_number,
-                    to=twilio_phone,
-                ),
+            response = await self._http_client.post(
+                self._twilio_endpoint,
+                data={"Body": message, "From": self.config.twilio_phone_number, "To": twilio_phone},
+                auth=self._twilio_auth,
                 timeout=self.config.twilio_timeout_seconds,
             )
-        except asyncio.TimeoutError:
-            duration_ms = round((time.perf_counter() - start) * 1000.0, 2)
+        except httpx.TimeoutException:
+            duration_ms = round((time.perf_counter_ns() - start) / 1_000_000, 2)
             return {
                 "success": False,
                 "provider": "twilio",
@@ -383,31 +546,39 @@ class SMSService:
                 "duration_ms": duration_ms,
                 "normalized_phone": twilio_phone,
             }
-        except TwilioRestException as exc:
-            duration_ms = round((time.perf_counter() - start) * 1000.0, 2)
+        except Exception as exc:
+            duration_ms = round((time.perf_counter_ns() - start) / 1_000_000, 2)
             return {
                 "success": False,
                 "provider": "twilio",
-                "error": f"Twilio error {exc.code}: {exc.msg}",
+                "error": f"Twilio exception: {exc}",
                 "duration_ms": duration_ms,
                 "normalized_phone": twilio_phone,
             }
-        except Exception as exc:
-            duration_ms = round((time.perf_counter() - start) * 1000.0, 2)
+
+        duration_ms = round((time.perf_counter_ns() - start) / 1_000_000, 2)
+
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        if not isinstance(body, dict):
+            body = {}
+
+        if response.status_code >= 400:
             return {
                 "success": False,
                 "provider": "twilio",
-                "error": f"Twilio exception: {exc}",
+                "error": f"Twilio error {body.get('code', response.status_code)}: "
+                f"{body.get('message') or (response.text or '')[:250]}",
                 "duration_ms": duration_ms,
                 "normalized_phone": twilio_phone,
             }
-
-        duration_ms = round((time.perf_counter() - start) * 1000.0, 2)
         return {
             "success": True,
             "provider": "twilio",
             "error": None,
-            "sid": getattr(message_obj, "sid", None),
+            "sid": body.get("sid"),
             "duration_ms": duration_ms,
             "normalized_phone": twilio_phone,
         }
@@ -417,16 +588,22 @@ class SMSService:
         provider: str,
         phone: str,
         message: str,
+        parsed: _ParsedPhone,
     ) -> dict[str, Any]:
-        circuit = self.mtarget_circuit if provider == "mtarget" else self.twilio_circuit
-        sender = self._send_via_mtarget_once if provider == "mtarget" else self._send_via_twilio_once
+        if provider == "mtarget":
+            circuit, sender, target = self.mtarget_circuit, self._send_via_mtarget_once, parsed.mtarget_form
+        else:
+            circuit, sender, target = self.twilio_circuit, self._send_via_twilio_once, parsed.e164_form
 
+        if target is None:
+            # Retrying cannot fix an unusable number, and it says nothing about provider health.
+            self.metrics.record_failure(provider)
+            return {"success": False, "provider": provider, "error": parsed.e164_error, "duration_ms": 0.0}
+
+        log = logger.bind(provider=provider, recipient=_mask_phone(phone))
         if not circuit.can_attempt():
             error_msg = f"{provider} circuit breaker open"
-            logger.warning(
-                "sms_provider_circuit_open",
-                extra={"channel": "sms", "provider": provider, "recipient": self._mask_phone(phone), "error": error_msg},
-            )
+            log.warning("sms_provider_circuit_open", extra={"error": error_msg})
             self.metrics.record_failure(provider)
             return {"success": False, "provider": provider, "error": error_msg}
 
@@ -438,7 +615,7 @@ class SMSService:
                 await asyncio.sleep(backoff)
 
             try:
-                result = await sender(phone, message)
+                result = await sender(target, message)
             except Exception as exc:
                 result = {
                     "success": False,
@@ -451,26 +628,21 @@ class SMSService:
             if result.get("success"):
                 circuit.record_success()
                 self.metrics.record_success(provider, float(result.get("duration_ms", 0.0)))
-                logger.info(
-                    "sms_send_success",
-                    extra={
-                        "channel": "sms",
-                        "provider": provider,
-                        "recipient": self._mask_phone(phone),
-                        "attempt": attempt,
-                        "duration_ms": result.get("duration_ms"),
-                        "sid": result.get("sid"),
-                        "sender": result.get("sender"),
-                    },
-                )
+                if log.isEnabledFor(logging.INFO):
+                    log.info(
+                        "sms_send_success",
+                        extra={
+                            "attempt": attempt,
+                            "duration_ms": result.get("duration_ms"),
+                            "sid": result.get("sid"),
+                            "sender": result.get("sender"),
+                        },
+                    )
                 return result
 
-            logger.warning(
+            log.warning(
                 "sms_send_retry_or_fail",
                 extra={
-                    "channel": "sms",
-                    "provider": provider,
-                    "recipient": self._mask_phone(phone),
                     "attempt": attempt,
                     "max_retries": self.config.max_retries,
                     "error": result.get("error"),
@@ -479,17 +651,57 @@ class SMSService:
 
         circuit.record_failure()
         self.metrics.record_failure(provider)
-        logger.error(
-            "sms_send_failed",
-            extra={
-                "channel": "sms",
-                "provider": provider,
-                "recipient": self._mask_phone(phone),
-                "error": last_result.get("error"),
-            },
-        )
+        log.error("sms_send_failed", extra={"error": last_result.get("error")})
         return last_result
 
+    async def _send_hedged(
+        self,
+        providers: tuple[str, ...],
+        phone: str,
+        message: str,
+        parsed: _ParsedPhone,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Race providers concurrently and cancel the others on the first success.
+
+        Cancellation cannot recall a request already sent, so a losing provider
+        may still deliver a second copy of the OTP; hedging is therefore only
+        used while the primary circuit is half-open. A cancelled loser whose
+        circuit was half-open never reports its probe, so it is recorded as a
+        failure to reopen the circuit instead of leaving it half-open.
+
+        Returns:
+            Results keyed by provider; cancelled providers are absent.
+        """
+        tasks = {
+            asyncio.create_task(self._send_with_retries(provider, phone, message, parsed)): provider
+            for provider in providers
+        }
+        results: dict[str, dict[str, Any]] = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    results[tasks[task]] = task.result()
+                if any(result.get("success") for result in results.values()):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                losers = list(pending)
+                outcomes = await asyncio.gather(*losers, return_exceptions=True)
+                for task, outcome in zip(losers, outcomes):
+                    provider = tasks[task]
+                    if isinstance(outcome, dict):
+                        results[provider] = outcome
+                        continue
+                    circuit = self.mtarget_circuit if provider == "mtarget" else self.twilio_circuit
+                    if circuit.state() == "half-open":
+                        circuit.record_failure()
+        return results
+
     async def send_otp_sms(self, phone: str, otp_code: str) -> dict[str, Any]:
         """
         Send OTP SMS with mTarget first and Twilio fallback.
@@ -498,7 +710,7 @@ class SMSService:
             error_msg = "Rate limit SMS atteint, réessayez plus tard."
             logger.error(
                 "sms_rate_limited",
-                extra={"channel": "sms", "provider": "system", "recipient": self._mask_phone(phone), "error": error_msg},
+                extra={"provider": "system", "recipient": _mask_phone(phone), "error": error_msg},
             )
             return {"success": False, "provider": None, "error": error_msg}
 
@@ -512,60 +724,92 @@ class SMSService:
             "Ne partagez JAMAIS ce code!"
         )
 
-        is_cm = self._is_cameroon_number(phone_clean)
+        parsed = self._parse_phone(phone_clean)
+        is_cm = parsed.is_cameroon
         primary_provider = "mtarget" if is_cm else "twilio"
         fallback_provider = "twilio" if is_cm else "mtarget"
 
-        logger.info(
-            "sms_send_attempt",
-            extra={
-                "channel": "sms",
-                "provider": primary_provider,
-                "recipient": self._mask_phone(phone_clean),
-                "sender": (self.config.mtarget_sender or "FM OTP").strip(),
-                "mtarget_url": self.config.mtarget_url,
-                "routing": "cameroon_primary_mtarget" if is_cm else "international_primary_twilio",
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "sms_send_attempt",
+                extra={
+                    "provider": primary_provider,
+                    "recipient": _mask_phone(phone_clean),
+                    "sender": self._mtarget_sender,
+                    "mtarget_url": self.config.mtarget_url,
+                    "routing": "cameroon_primary_mtarget" if is_cm else "international_primary_twilio",
+                },
+            )
 
-        primary_result = await self._send_with_retries(primary_provider, phone_clean, message)
-        if primary_result.get("success"):
-            return primary_result
+        primary_circuit = self.mtarget_circuit if primary_provider == "mtarget" else self.twilio_circuit
+        primary_state = primary_circuit.state()
+        if primary_state == "half-open":
+            # Primary is probing recovery: hedge with the fallback instead of waiting out
+            # its retries. An open circuit fails fast below and goes straight to fallback.
+            logger.warning(
+                "sms_hedged_send",
+                extra={
+                    "provider": primary_provider,
+                    "fallback_provider": fallback_provider,
+                    "recipient": _mask_phone(phone_clean),
+                    "circuit_state": primary_state,
+                },
+            )
+            results = await self._send_hedged(
+                (primary_provider, fallback_provider), phone_clean, message, parsed
+            )
+            for result in results.values():
+                if result.get("success"):
+                    return result
+            primary_result = results[primary_provider]
+            fallback_result = results[fallback_provider]
+        else:
+            primary_result = await self._send_with_retries(primary_provider, phone_clean, message, parsed)
+            if primary_result.get("success"):
+                return primary_result
 
-        logger.warning(
-            "sms_fallback_provider",
-            extra={
-                "channel": "sms",
-                "provider": fallback_provider,
-                "recipient": self._mask_phone(phone_clean),
-                "error": primary_result.get("error"),
-            },
-        )
+            logger.warning(
+                "sms_fallback_provider",
+                extra={
+                    "provider": fallback_provider,
+                    "recipient": _mask_phone(phone_clean),
+                    "error": primary_result.get("error"),
+                },
+            )
 
-        fallback_result = await self._send_with_retries(fallback_provider, phone_clean, message)
-        if fallback_result.get("success"):
-            return fallback_result
+            fallback_result = await self._send_with_retries(fallback_provider, phone_clean, message, parsed)
+            if fallback_result.get("success"):
+                return fallback_result
 
-        logger.error(
-            "sms_all_providers_failed",
-            extra={
-                "channel": "sms",
-                "recipient": self._mask_phone(phone_clean),
-                "primary_provider": primary_provider,
-                "primary_error": primary_result.get("error"),
-                "fallback_provider": fallback_provider,
-                "fallback_error": fallback_result.get("error"),
-                "metrics": self.metrics.snapshot(),
-            },
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "sms_all_providers_failed",
+                extra={
+                    "recipient": _mask_phone(phone_clean),
+                    "primary_provider": primary_provider,
+                    "primary_error": primary_result.get("error"),
+                    "fallback_provider": fallback_provider,
+                    "fallback_error": fallback_result.get("error"),
+                    "metrics": self.metrics.snapshot(),
+                },
+            )
         return {
             "success": False,
             "provider": None,
             "error": "Echec d'envoi SMS. Veuillez reessayer ou utiliser l'email.",
         }
 
+    async def aclose(self) -> None:
+        """Close pooled provider connections."""
+        await self._http_client.aclose()
+
     def get_metrics(self) -> dict[str, Any]:
         data = self.metrics.snapshot()
+        data["duration_bounds_ms"] = list(METRICS_DURATION_BOUNDS_MS)
+        data["duration_quantiles_ms"] = {
+            provider: {f"p{round(q * 100)}": _histogram_quantile(counts, q) for q in METRICS_QUANTILES}
+            for provider, counts in data["duration_buckets_ms"].items()
+        }
         data["circuit_breakers"] = {
             "mtarget": self.mtarget_circuit.state(),
             "twilio": self.twilio_circuit.state(),
@@ -592,7 +836,7 @@ class SMSService:
                     "circuit_state": mtarget_state,
                 },
                 "twilio": {
-                    "configured": bool(self.twilio_client),
+                    "configured": self.twilio_configured,
                     "circuit_state": twilio_state,
                 },
             },
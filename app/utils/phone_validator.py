@@ -1,10 +1,68 @@
 """
 Phone validation utilities for Cameroon phone numbers
 """
-import re
+import functools
 from typing import Tuple
 
 
+_INVALID_PHONE_MESSAGE = "Format de numéro invalide. Utilisez: 6XX XX XX XX, 237XXXXXXXXX ou +237XXXXXXXXX"
+
+
+def _matches_cameroon_formats(phone: str) -> bool:
+    """
+    Check a stripped number against the accepted formats without regex:
+    6XX XX XX XX (spaces optional), 237XXXXXXXXX or +237XXXXXXXXX.
+    """
+    if phone.startswith("+237"):
+        return len(phone) == 13 and phone[4:].isdecimal()
+    if phone.startswith("237"):
+        return len(phone) == 12 and phone[3:].isdecimal()
+    if not phone.startswith("6"):
+        return False
+
+    # 6XX then three "XX" groups, each optionally preceded by one whitespace
+    if len(phone) < 3 or not phone[1:3].isdecimal():
+        return False
+    index = 3
+    for _ in range(3):
+        if phone[index:index + 1].isspace():
+            index += 1
+        group = phone[index:index + 2]
+        if len(group) != 2 or not group.isdecimal():
+            return False
+        index += 2
+    return index == len(phone)
+
+
+def _normalize_stripped(phone: str) -> str:
+    """
+    Build the +237XXXXXXXXX form of an already-stripped valid number.
+    """
+    if phone.startswith("+"):
+        return phone
+    if phone.startswith("237"):
+        return f"+{phone}"
+    # Local 6XX XX XX XX form: drop the group separators
+    return "+237" + "".join(phone.split())
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse(phone: str) -> Tuple[bool, str, str]:
+    """
+    Validate and normalize a phone number in a single pass, memoized per input.
+
+    Returns:
+        Tuple[bool, str, str]: (is_valid, normalized_phone, error_message)
+    """
+    if not phone:
+        return False, "", _INVALID_PHONE_MESSAGE
+
+    clean = phone.strip()
+    if not _matches_cameroon_formats(clean):
+        return False, "", _INVALID_PHONE_MESSAGE
+    return True, _normalize_stripped(clean), ""
+
+
 def is_valid_cameroon_phone(phone: str) -> bool:
     """
     Validate Cameroon phone number formats:
@@ -19,18 +77,7 @@ def is_valid_cameroon_phone(phone: str) -> bool:
     Returns:
         bool: True if valid Cameroon number, False otherwise
     """
-    if not phone:
-        return False
-    
-    phone = phone.strip()
-    
-    patterns = [
-        r'^6\d{2}\s?\d{2}\s?\d{2}\s?\d{2}$',  # 6XX XX XX XX or 6XXXXXXXX
-        r'^237\d{9}$',  # 237XXXXXXXXX
-        r'^\+237\d{9}$'  # +237XXXXXXXXX
-    ]
-    
-    return any(re.match(pattern, phone) for pattern in patterns)
+    return _parse(phone)[0]
 
 
 def normalize_cameroon_phone(phone: str) -> str:
@@ -46,22 +93,10 @@ def normalize_cameroon_phone(phone: str) -> str:
     Raises:
         ValueError: If phone number is invalid
     """
-    if not is_valid_cameroon_phone(phone):
+    is_valid, normalized, _ = _parse(phone)
+    if not is_valid:
         raise ValueError(f"Invalid Cameroon phone number: {phone}")
-    
-    # Remove all spaces
-    phone = phone.replace(" ", "")
-    
-    # If starts with 6, add country code
-    if phone.startswith("6"):
-        return f"+237{phone}"
-    
-    # If starts with 237, add +
-    if phone.startswith("237"):
-        return f"+{phone}"
-    
-    # Already in correct format
-    return phone
+    return normalized
 
 
 def validate_and_normalize_phone(phone: str) -> Tuple[bool, str, str]:
@@ -74,11 +109,4 @@ def validate_and_normalize_phone(phone: str) -> Tuple[bool, str, str]:
     Returns:
         Tuple[bool, str, str]: (is_valid, normalized_phone, error_message)
     """
-    try:
-        if not is_valid_cameroon_phone(phone):
-            return False, "", "Format de numéro invalide. Utilisez: 6XX XX XX XX, 237XXXXXXXXX ou +237XXXXXXXXX"
-        
-        normalized = normalize_cameroon_phone(phone)
-        return True, normalized, ""
-    except Exception as e:
-        return False, "", str(e)
+    return _parse(phone)
@@ -1,21 +1,81 @@
+import hashlib
+import hmac
+import time
 import bcrypt
+import orjson
 from jose import JWTError, jwt
+from jose.exceptions import ExpiredSignatureError
+from jose.utils import base64url_decode
 from datetime import datetime, timedelta
 from typing import Optional
 from app.config import settings
+from app.utils.cache import TTLCache
 
 # JWT settings
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
+_ALGS = (ALGORITHM,)
+# Admin tokens carry no aud/iss/at_hash claims, so skip those checks
+_DECODE_OPTIONS = {"verify_aud": False, "verify_iss": False, "verify_at_hash": False}
+# Token shapes the HS256 fast path handles itself; anything else goes through jose
+_FAST_HEADER_KEYS = frozenset({"alg", "typ"})
+_FAST_CLAIM_KEYS = frozenset({"sub", "exp"})
+# Key bytes and a keyed HMAC whose copy() skips the pad setup on every verify
+_SECRET_BYTES = settings.SECRET_KEY.encode("utf-8")
+_HMAC_TEMPLATE = hmac.new(_SECRET_BYTES, None, hashlib.sha256)
+
+# Decoded payloads of recently seen valid tokens, never kept past their own exp;
+# keyed by token digest so cached credentials stay small and are not kept verbatim
+TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache = TTLCache(maxsize=1024, ttl_seconds=TOKEN_CACHE_TTL_SECONDS)
+# Recently rejected tokens (by digest), kept briefly so floods of bad tokens skip verification
+INVALID_TOKEN_CACHE_TTL_SECONDS = 5
+# Issued tokens carry only sub and exp (~200 chars); anything far longer is rejected
+# outright without being hashed, verified or cached
+MAX_TOKEN_LENGTH = 2048
+_invalid_token_cache = TTLCache(maxsize=4096, ttl_seconds=INVALID_TOKEN_CACHE_TTL_SECONDS)
+
+# Digests of (password, hash) pairs that verified successfully
+VERIFY_CACHE_TTL_SECONDS = 3600
+_verify_cache = TTLCache(maxsize=2048, ttl_seconds=VERIFY_CACHE_TTL_SECONDS)
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+_BCRYPT_HASH_LENGTH = 60
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Check whether a bcrypt hash was made with a cost other than BCRYPT_ROUNDS"""
+    parts = (hashed_password or "").split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return True
+    return int(parts[2]) != settings.BCRYPT_ROUNDS
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    # Structurally malformed hashes can never match; valid ones always take the full path
+    if (
+        not hashed_password
+        or len(hashed_password) != _BCRYPT_HASH_LENGTH
+        or not hashed_password.startswith(_BCRYPT_PREFIXES)
+    ):
+        return False
+    plain_bytes = plain_password.encode('utf-8')
+    hashed_bytes = hashed_password.encode('utf-8')
+    if not settings.BCRYPT_VERIFY_CACHE:
+        return bcrypt.checkpw(plain_bytes, hashed_bytes)
+
+    cache_key = hashlib.sha256(plain_bytes + b'|' + hashed_bytes).digest()
+    if _verify_cache.get(cache_key):
+        return True
+    if not bcrypt.checkpw(plain_bytes, hashed_bytes):
+        return False
+    _verify_cache.set(cache_key, True)
+    return True
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -37,11 +97,65 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SECRET_BYTES, algorithm=ALGORITHM)
     
     return encoded_jwt
 
 
+def _fast_verify_hs256(token: str) -> Optional[dict]:
+    """
+    Verify an HS256 token with hmac/hashlib directly, bypassing jose's generic dispatch
+    
+    Args:
+        token: JWT token to verify
+        
+    Returns:
+        Optional[dict]: Payload, or None when the token needs the full jose path
+        
+    Raises:
+        JWTError: If the signature is wrong or the token has expired
+    """
+    segments = token.split(".")
+    if len(segments) != 3:
+        return None
+    header_b64, payload_b64, signature_b64 = segments
+    try:
+        header = orjson.loads(base64url_decode(header_b64.encode("ascii")))
+        if not isinstance(header, dict) or header.get("alg") != ALGORITHM:
+            return None
+        if not _FAST_HEADER_KEYS.issuperset(header):
+            return None
+        signature = base64url_decode(signature_b64.encode("ascii"))
+        payload_bytes = base64url_decode(payload_b64.encode("ascii"))
+    except (ValueError, UnicodeError):
+        return None
+
+    mac = _HMAC_TEMPLATE.copy()
+    mac.update(f"{header_b64}.{payload_b64}".encode("ascii"))
+    if not hmac.compare_digest(mac.digest(), signature):
+        raise JWTError("Signature verification failed.")
+
+    try:
+        payload = orjson.loads(payload_bytes)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict) or not _FAST_CLAIM_KEYS.issuperset(payload):
+        return None
+    if "sub" in payload and not isinstance(payload["sub"], str):
+        return None
+    if "exp" in payload:
+        if type(payload["exp"]) is not int:
+            return None
+        if payload["exp"] < int(time.time()):
+            raise ExpiredSignatureError("Signature has expired.")
+    return payload
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Fixed-size cache key for a bearer token"""
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """
     Decode and verify a JWT token
@@ -52,8 +166,25 @@ def decode_access_token(token: str) -> Optional[dict]:
     Returns:
         Optional[dict]: Decoded token data or None if invalid
     """
+    if len(token) > MAX_TOKEN_LENGTH:
+        return None
+
+    cache_key = _token_cache_key(token)
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
+    if _invalid_token_cache.get(cache_key):
+        return None
+
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        payload = _fast_verify_hs256(token)
+        if payload is None:
+            payload = jwt.decode(token, _SECRET_BYTES, algorithms=_ALGS, options=_DECODE_OPTIONS)
     except JWTError:
+        _invalid_token_cache.set(cache_key, True)
         return None
+
+    exp = payload.get("exp")
+    ttl_seconds = exp - time.time() if isinstance(exp, (int, float)) else None
+    _token_cache.set(cache_key, dict(payload), ttl_seconds=ttl_seconds)
+    return payload
@@ -5,8 +5,19 @@ import re
 from typing import Tuple
 
 
-_STUDENT_NAME_PATTERN = re.compile(r"^[A-Za-zÀ-ÖØ-öø-ÿ' -]{2,120}$")
-_DISALLOWED_INPUT_PATTERN = re.compile(r"[<>{}\\;$`]")
+# Whitelist of [A-Za-zÀ-ÖØ-öø-ÿ' -]: translating a valid name removes every character
+_STUDENT_NAME_ALLOWED = "".join(
+    chr(code)
+    for start, end in ((0x41, 0x5A), (0x61, 0x7A), (0xC0, 0xD6), (0xD8, 0xF6), (0xF8, 0xFF))
+    for code in range(start, end + 1)
+) + "' -"
+_STUDENT_NAME_TABLE = str.maketrans("", "", _STUDENT_NAME_ALLOWED)
+_DISALLOWED_INPUT_TABLE = str.maketrans("", "", "<>{}\\;$`")
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r"\s+")
+# Above this length sanitize_input falls back to the two regex passes
+_SCAN_MAX_LENGTH = 4096
 
 
 def validate_email(email: str) -> Tuple[bool, str]:
@@ -22,10 +33,7 @@ def validate_email(email: str) -> Tuple[bool, str]:
     if not email:
         return False, "Email requis"
     
-    # Basic email regex
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
-    if not re.match(pattern, email.strip()):
+    if not _EMAIL_PATTERN.match(email.strip()):
         return False, "Format d'email invalide"
     
     return True, ""
@@ -42,7 +50,7 @@ def validate_student_name(name: str) -> Tuple[bool, str]:
     if len(clean) < 2 or len(clean) > 120:
         return False, "Nom étudiant invalide (longueur)"
 
-    if not _STUDENT_NAME_PATTERN.match(clean):
+    if clean.translate(_STUDENT_NAME_TABLE):
         return False, "Nom étudiant invalide (caractères non autorisés)"
 
     return True, ""
@@ -54,7 +62,46 @@ def has_disallowed_input(value: str) -> bool:
     """
     if not value:
         return False
-    return bool(_DISALLOWED_INPUT_PATTERN.search(value))
+    return len(value.translate(_DISALLOWED_INPUT_TABLE)) != len(value)
+
+
+def _strip_tags_and_ws(text: str) -> str:
+    """
+    Equivalent of _TAG_RE.sub('') followed by _WS_RE.sub(' ') using str methods.
+    """
+    if '<' in text:
+        parts = []
+        start = 0
+        pos = text.find('<')
+        while pos != -1:
+            end = text.find('>', pos + 1)
+            if end == -1:
+                break
+            if end > pos + 1:
+                parts.append(text[start:pos])
+                start = end + 1
+                pos = text.find('<', start)
+            else:
+                # "<>" is not a tag; keep scanning after it
+                pos = text.find('<', end)
+        if parts:
+            parts.append(text[start:])
+            text = ''.join(parts)
+
+    # Every whitespace character except ' ' is non-printable, so a printable
+    # text without double spaces has nothing to collapse
+    if '  ' not in text and text.isprintable():
+        return text
+
+    words = text.split()
+    if not words:
+        return ' ' if text else ''
+    collapsed = ' '.join(words)
+    if text[0].isspace():
+        collapsed = ' ' + collapsed
+    if text[-1].isspace():
+        collapsed += ' '
+    return collapsed
 
 
 def sanitize_input(text: str, max_length: int = 255) -> str:
@@ -71,16 +118,11 @@ def sanitize_input(text: str, max_length: int = 255) -> str:
     if not text:
         return ""
     
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    
-    # Limit length
-    text = text[:max_length]
-    
-    # Remove any HTML tags (basic protection)
-    text = re.sub(r'<[^>]+>', '', text)
-
-    # Normalize internal spacing
-    text = re.sub(r"\s+", " ", text)
+    # Remove leading/trailing whitespace and limit length before scanning;
+    # both return the same object when there is nothing to cut
+    text = text.strip()[:max_length]
     
-    return text
+    # Remove any HTML tags (basic protection) and normalize internal spacing
+    if len(text) > _SCAN_MAX_LENGTH:
+        return _WS_RE.sub(" ", _TAG_RE.sub('', text))
+    return _strip_tags_and_ws(text)
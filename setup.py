@@ -5,13 +5,18 @@ This creates routers, templates, and static files
 """
 import os
 
+DIRS = (
+    "app/routers",
+    "templates/admin",
+    "templates/public",
+    "static/css",
+    "static/js",
+    "deploy",
+)
+
 # Create directories if they don't exist
-os.makedirs("app/routers", exist_ok=True)
-os.makedirs("templates/admin", exist_ok=True)
-os.makedirs("templates/public", exist_ok=True)
-os.makedirs("static/css", exist_ok=True)
-os.makedirs("static/js", exist_ok=True)
-os.makedirs("deploy", exist_ok=True)
+for d in DIRS:
+    os.makedirs(d, exist_ok=True)
 
 print("✅ All directories created successfully!")
 print("\n📝 Project structure is ready!")